@@ -1,40 +1,59 @@
 __all__ = ('Form', )
 
-from collections import defaultdict
-
 from pyvalidator.core.validators import Field
 
+# Marker for fields which are not provided in form data
+_MISSING = object()
+
 
 class BaseFormMetaClass(type):
     def __new__(cls, name, bases, attrs: dict):
         # Get all class attributes and add to dict
         # This piece of code is inspired from Django:
         # https://github.com/django/django/blob/main/django/forms/forms.py#L24
-        attrs["declared_fields"] = {
-            key: attrs.get(key)
-            for key, value in list(attrs.items())
-            if isinstance(value, Field)
+        own_fields = {
+            key: value
+            for key, value in attrs.items()
+            # Skip dunder attributes (__module__, __qualname__, ...), they are never fields
+            if not key.startswith('__') and isinstance(value, Field)
         }
 
         new_class = super().__new__(cls, name, bases, attrs)
 
         declared_fields: dict[str, Field] = {}
-        # Loop through the super class and get all class attributes
-        for base_class in reversed(new_class.__mro__):
-            if hasattr(base_class, 'declared_fields'):
-                declared_fields.update(base_class.declared_fields)
+        # Base classes already merged fields of their own bases, so only direct bases are needed.
+        # Reverse them to let the first base take precedence, as in the MRO
+        for base_class in reversed(bases):
+            declared_fields.update(getattr(base_class, 'declared_fields', {}))
+
+        declared_fields.update(own_fields)
 
         new_class.declared_fields = declared_fields
+        # Fields are not changed after class creation, keep a tuple for fast iteration on clean
+        new_class._declared_fields_items = tuple(declared_fields.items())
+
+        # Lookup custom clean_<field> method names once, instead of formatting and checking them on every clean
+        field_cleaners = {}
+        for field_name in declared_fields:
+            cleaner_name = 'clean_%s' % field_name
+            if hasattr(new_class, cleaner_name):
+                field_cleaners[field_name] = cleaner_name
+
+        new_class._field_cleaners = field_cleaners
+        new_class._has_clean = callable(getattr(new_class, 'clean', None))
 
         return new_class
 
 
 class Form(metaclass=BaseFormMetaClass):
+    # Subclasses declaring fields are not slotted, field values are stored in their __dict__
+    __slots__ = ('_data', '_cleaned_data', '_raise_exception_on_error', '_errors')
+
     def __init__(self, data: dict = None, raise_exception_on_error=False):
         self._data = data if data else {}
         self._cleaned_data = {}
         self._raise_exception_on_error = raise_exception_on_error
-        self._errors = defaultdict(list)
+        self._errors = {}
 
     @property
     def cleaned_data(self):
@@ -73,11 +92,9 @@ class Form(metaclass=BaseFormMetaClass):
         -----
         Custom clean method for field must start with clean_<field-name>
         """
-        clean_func_name = 'clean_%s' % field_name
-        if hasattr(self, clean_func_name):
-            func = getattr(self, clean_func_name)
-
-            return func(field_value)
+        cleaner_name = self._field_cleaners.get(field_name)
+        if cleaner_name is not None:
+            return getattr(self, cleaner_name)(field_value)
 
         return field_value
 
@@ -85,19 +102,41 @@ class Form(metaclass=BaseFormMetaClass):
         """
         Clean form data and set value fields
         """
-        for key, value in self.declared_fields.items():
+        data = self._data
+        cleaned_data = self._cleaned_data
+        for key, field in self._declared_fields_items:
+            raw_value = data.get(key, _MISSING)
+            if raw_value is _MISSING:
+                # Nullable fields can be omitted, others are reported as missing
+                if not field._nullable:
+                    self._add_error(key, KeyError(key))
+                continue
+
             try:
-                setattr(self, key, self._data[key])
-                # Call the custom clean methods first
-                cleaned_field = self._clean_field(key, getattr(self, key))
-                # Set value to field
-                setattr(self, key, cleaned_field)
-                self._cleaned_data[key] = value
+                # Set raw value to field, which converts and validates it
+                setattr(self, key, raw_value)
+                field_value = getattr(self, key)
+                # Call the custom clean methods
+                cleaned_field = self._clean_field(key, field_value)
+                # Only set the value again if it was changed by the clean method
+                if cleaned_field is not field_value:
+                    setattr(self, key, cleaned_field)
+                cleaned_data[key] = cleaned_field
             except Exception as ex:
-                if self._raise_exception_on_error:
-                    raise ex
-                else:
-                    self._errors[key].append(ex)
+                self._add_error(key, ex)
+
+    def _add_error(self, key: str, error: Exception):
+        """
+        Raise error or add it to form errors, depends on raise_exception_on_error
+        Parameters
+        ----------
+        key (str): field name, or form name for errors raised in clean
+        error (Exception): error to be raised or added
+        """
+        if self._raise_exception_on_error:
+            raise error
+
+        self._errors.setdefault(key, []).append(error)
 
     def full_clean(self):
         """ Run full clean on input data """
@@ -109,10 +148,7 @@ class Form(metaclass=BaseFormMetaClass):
 
         # Run custom clean, usually use with cleaned_data
         try:
-            if hasattr(self, 'clean') and not self._errors:
-                getattr(self, 'clean')()
+            if self._has_clean and not self._errors:
+                self.clean()
         except Exception as ex:
-            if self._raise_exception_on_error:
-                raise ex
-            else:
-                self._errors[self.__class__.__name__].append(ex)
+            self._add_error(self.__class__.__name__, ex)
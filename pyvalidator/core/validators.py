@@ -12,6 +12,7 @@ __all__ = (
     'DateTimeField',
 )
 
+import math
 import re
 from datetime import date, datetime
 
@@ -19,9 +20,54 @@ from dateutil.parser import parse
 
 from pyvalidator.core.exceptions import ConversionError
 
+try:
+    # google-re2 matches in linear time, use it for built-in patterns when it is installed
+    import re2 as regex_engine
+except ImportError:
+    regex_engine = re
+
+try:
+    # ciso8601 parses ISO 8601 strings in C, use it when it is installed
+    from ciso8601 import parse_datetime as parse_iso_datetime
+except ImportError:
+    parse_iso_datetime = datetime.fromisoformat
+
+try:
+    # hyperscan is an optional dependency, used to match patterns of many strings at once
+    import hyperscan
+except ImportError:
+    hyperscan = None
+
+try:
+    # numpy and numba are optional dependencies, used to speed up batch validation
+    import numpy as np
+except ImportError:
+    np = None
+
+try:
+    import numba
+except ImportError:
+    numba = None
+
 # Define a UnionType for Numeric base class
 NumericType = int | float
-VALIDATION_ERROR_MESSAGE = 'Field `{field_name}` value {field_value} is {error} {boundary_value}'
+
+# Compiled patterns by pattern source and Hyperscan databases by expression,
+# shared by every field using the same pattern
+_COMPILED_PATTERNS = {}
+_HYPERSCAN_DATABASES = {}
+
+# Storage of fields which are not bound to an attribute name yet, never set on instances so they read the default
+_UNBOUND_STORAGE_NAME = '<unbound>'
+
+
+if numba is not None:
+    @numba.njit(cache=True)
+    def _range_kernel(values, min_value, max_value):
+        result = np.empty(values.shape[0], np.bool_)
+        for i in range(values.shape[0]):
+            result[i] = not (values[i] < min_value or values[i] > max_value)
+        return result
 
 
 ###################
@@ -36,6 +82,19 @@ class Field:
     Read this guideline, especially section: Technical Tutorial to understand what they do
     """
     __field_type__ = None
+    __slots__ = (
+        '_default',
+        '_nullable',
+        '_force_conversion',
+        '_conversion_func',
+        '_custom_validators',
+        '_field_name',
+        '_owner_klass',
+        '_validate',
+        '_storage_name',
+    )
+    # Fields shared by `interned`, keyed by field class and settings
+    _INTERNED: dict[tuple, 'Field'] = {}
 
     def __init__(
         self,
@@ -58,36 +117,113 @@ class Field:
         if self.__field_type__ is None:
             raise ValueError('Type is not set for field')
 
-        self._value = default
+        self._default = default
         self._nullable = nullable
         self._force_conversion = force_conversion
         self._conversion_func = custom_conversion or self.__field_type__
+        # Set by __set_name__ when the field is declared in a class body
+        self._field_name = None
+        self._storage_name = _UNBOUND_STORAGE_NAME
+        self._validate = self._validate_unbound
 
         if custom_validators is None:
             self._custom_validators = []
         else:
             self._custom_validators = custom_validators
 
+    @classmethod
+    def interned(cls, **kwargs):
+        """
+        Return a field shared by every declaration with the same settings,
+        values are stored on the owner instances, so sharing a field is safe
+
+        Parameters
+        ----------
+        kwargs: settings of the field, fields with unhashable settings are not shared
+
+        Returns
+        -------
+        field (Field): shared field for the given settings
+
+        Notes
+        -----
+        A field is bound to its attribute name, a shared field must always be declared with the same name
+        """
+        # Equal settings of different types (e.g. True and 1) must not share a field
+        key = (cls, tuple(sorted((name, type(value), value) for name, value in kwargs.items())))
+        try:
+            field = Field._INTERNED.get(key)
+        except TypeError:
+            return cls(**kwargs)
+
+        if field is None:
+            field = Field._INTERNED[key] = cls(**kwargs)
+
+        return field
+
     def __set_name__(self, owner, name):
+        field_name = self._field_name
+        if field_name is not None and field_name != name:
+            # Values are stored by field name, binding a field to another name would mix up values
+            raise ValueError(
+                '%s is already declared as %s, it cannot be declared as %s' % (self.__class__.__name__, field_name, name)
+            )
+
+        # Values are stored in `_<name>`, a slot when owner declares it. A shared field keeps the same storage
+        # for all of its owners
+        candidates = (self._storage_name, ) if field_name is not None else ('_%s' % name, '_%s_value' % name)
+        for storage_name in candidates:
+            if self._can_store_in(owner, name, storage_name):
+                break
+        else:
+            raise ValueError(
+                '%s cannot store %s value in %s, it is already used by %s' % (
+                    self.__class__.__name__, name, ' or '.join(candidates), owner.__name__
+                )
+            )
+
         self._field_name = name
         self._owner_klass = owner.__class__
+        self._storage_name = storage_name
+        self._build_error_templates()
+        self._validate = self._build_validate()
 
     def __get__(self, instance, owner):
-        return self._value
+        if instance is None:
+            return self
+
+        return getattr(instance, self._storage_name, self._default)
 
     def __set__(self, instance, value: any) -> None:
-        value = self._convert_value(value)
+        # Value is safe to be set once validated, store it on the owner instance so the field itself
+        # stays shared and read-only across all instances of the owner class
+        setattr(instance, self._storage_name, self._validate(value))
+
+    def _can_store_in(self, owner, name, storage_name):
+        """
+        Return True if instances of owner can store the field value in storage_name, the name must not be used by
+        owner or its bases for something else than a slot declared along the field (e.g. Form slots)
+        """
+        for klass in owner.__mro__:
+            if storage_name in klass.__dict__:
+                slots = klass.__dict__.get('__slots__', ())
+                if isinstance(slots, str):
+                    slots = (slots, )
+                return storage_name in slots and klass.__dict__.get(name) is self
 
-        self.validate(value)
+        return True
 
-        # Value is safe to be set
-        self._value = value
+    def _validate_unbound(self, value):
+        raise ValueError(
+            '%s is not bound to an attribute name, declare it in a class body or bind it with '
+            '__set_name__(owner, name)' % self.__class__.__name__
+        )
 
     def set_conversion_func(self, func: callable):
         self._conversion_func = func
 
     def _convert_value(self, value: any):
-        if self._force_conversion and not isinstance(value, self.__field_type__):
+        if self._force_conversion and value is not None and not isinstance(value, self.__field_type__):
             try:
                 return self._conversion_func(value)
             except Exception as ex:
@@ -99,16 +235,86 @@ class Field:
         raise NotImplementedError('Initial validator for %s is not implemented' % self.__class__.__name__)
 
     def _get_error_message(self, field_name, field_value, error, boundary_value=None):
-        return VALIDATION_ERROR_MESSAGE.format(
-            field_name=field_name,
-            field_value=field_value,
-            error=error,
-            boundary_value=boundary_value,
-        ).strip()
+        if boundary_value is None:
+            return f'Field `{field_name}` value {field_value} is {error}'
+
+        return f'Field `{field_name}` value {field_value} is {error} {boundary_value}'
+
+    def _error_template(self, error, boundary_value=None):
+        """
+        Return error message with a `%s` placeholder for the field value,
+        every other part is known once the field is declared
+        """
+        message = self._get_error_message(self._field_name, '\0', error, boundary_value)
+
+        return message.replace('%', '%%').replace('\0', '%s')
+
+    def _build_error_templates(self):
+        """
+        Build error templates used by `_built_in_validation`, called when the field is bound to its owner
+        """
+
+    def _build_validate(self):
+        """
+        Build a function converting and validating value, specialized for this field.
+        Every setting known on field declaration is bound to the function, so it does not look them up on each set
+
+        Returns
+        -------
+        validate (callable): function returning the value to be set, raise errors as `_convert_value` and `validate`
+        """
+        convert_value = self._convert_value
+        if type(self).validate is not Field.validate or type(self)._convert_value is not Field._convert_value:
+            # Keep behavior of subclasses which override validate or conversion
+            validate_value = self.validate
+
+            def convert_and_validate(value):
+                value = convert_value(value)
+                validate_value(value)
+                return value
+
+            return convert_and_validate
+
+        field_name = self._field_name
+        field_type = self.__field_type__
+        nullable = self._nullable
+        force_conversion = self._force_conversion
+        built_in_validation = self._built_in_validation
+        custom_validators = tuple(self._custom_validators)
+        # Messages only depend on field settings, format them once rather than on every failure
+        null_error_message = '%s field is not nullable' % field_name
+        type_error_message = '%s value is not a valid type for %s' % (field_name, field_type)
+
+        def validate(value):
+            if value is None:
+                if not nullable:
+                    raise ValueError(null_error_message)
+                return value
+
+            # Values of the right type skip conversion, so the type is checked only once
+            if not isinstance(value, field_type):
+                if not force_conversion:
+                    raise ValueError(type_error_message)
+
+                value = convert_value(value)
+                # Custom conversion may return another type
+                if not isinstance(value, field_type):
+                    raise ValueError(type_error_message)
+
+            built_in_validation(value)
+
+            for validator in custom_validators:
+                validator(value)
+
+            return value
+
+        return validate
 
     def validate(self, value: any):
-        if value is None and self._nullable is False:
-            raise ValueError('%s field is not nullable' % self._field_name)
+        if value is None:
+            if self._nullable is False:
+                raise ValueError('%s field is not nullable' % self._field_name)
+            return
 
         if not isinstance(value, self.__field_type__):
             raise ValueError(
@@ -133,6 +339,7 @@ class NumericField(Field):
     Set __field_type__ properly if you want to use this base class, since `NumericType` is an UnionType and not callable
     """
     __field_type__ = NumericType
+    __slots__ = ('_min_value', '_max_value', '_min_value_error', '_max_value_error')
 
     def __init__(
         self,
@@ -145,34 +352,55 @@ class NumericField(Field):
         self._max_value = self.__field_type__(max_value) if max_value is not None else max_value
         super().__init__(**kwargs)
 
+    def _build_error_templates(self):
+        self._min_value_error = self._error_template('smaller than min value', self._min_value)
+        self._max_value_error = self._error_template('greater than max value', self._max_value)
+
     def _built_in_validation(self, value):
-        if self._min_value is not None and value < self._min_value:
-            raise ValueError(
-                self._get_error_message(
-                    field_name=self._field_name,
-                    field_value=value,
-                    error='smaller than min value',
-                    boundary_value=self._min_value
-                )
-            )
+        min_value = self._min_value
+        max_value = self._max_value
 
-        if self._max_value is not None and value > self._max_value:
-            raise ValueError(
-                self._get_error_message(
-                    field_name=self._field_name,
-                    field_value=value,
-                    error='greater than max value',
-                    boundary_value=self._max_value,
-                )
-            )
+        if min_value is not None and value < min_value:
+            raise ValueError(self._min_value_error % (value, ))
+
+        if max_value is not None and value > max_value:
+            raise ValueError(self._max_value_error % (value, ))
+
+    def validate_batch(self, values):
+        """
+        Check min value and max value for many values at once
+
+        Parameters
+        ----------
+        values (Iterable[NumericType]): values to be checked
+
+        Returns
+        -------
+        result (Sequence[bool]): True for every value within the boundaries, else False.
+        A numpy array is returned when numpy is installed, else a list
+        """
+        # Compare the way single values are validated, so NaN is not rejected by the boundaries
+        min_value = -math.inf if self._min_value is None else self._min_value
+        max_value = math.inf if self._max_value is None else self._max_value
+
+        if numba is not None:
+            return _range_kernel(np.asarray(values), min_value, max_value)
+
+        if np is not None:
+            values = np.asarray(values)
+            return ~((values < min_value) | (values > max_value))
+
+        return [not (value < min_value or value > max_value) for value in values]
 
 
 class IntField(NumericField):
     __field_type__ = int
+    __slots__ = ()
 
 
-class FloatField(Field):
+class FloatField(NumericField):
     __field_type__ = float
+    __slots__ = ()
 
 
 #####################
@@ -180,7 +408,21 @@ class FloatField(Field):
 #####################
 class StringField(Field):
     __field_type__ = str
+    __slots__ = (
+        '_min_length',
+        '_max_length',
+        '_regex_match',
+        '_min_length_error',
+        '_max_length_error',
+        '_pattern_error',
+    )
+    # Pattern to match values against, either compiled or a string compiled on first use
     REGEX_PATTERN = None
+    # Match the whole value rather than its start, the same under `re` and re2, unlike a `$` anchor
+    # which `re` also matches before a trailing newline
+    REGEX_FULL_MATCH = False
+    # Optional function rejecting values which cannot match the pattern, without running the regex engine
+    _quick_check = None
 
     def __init__(
         self,
@@ -194,111 +436,234 @@ class StringField(Field):
         self._max_length = max_length
         super().__init__(**kwargs)
 
-    def _regex_validation(self, value):
-        if not re.match(self.REGEX_PATTERN, value):
-            raise ValueError(
-                self._get_error_message(
-                    field_name=self._field_name,
-                    field_value=value,
-                    error='not a valid pattern',
-                    boundary_value='',
-                )
-            )
+        pattern = self._get_pattern()
+        if pattern is not None:
+            # Bind the match method once, so validation does not go through `re` module dispatch
+            self._regex_match = pattern.fullmatch if self.REGEX_FULL_MATCH else pattern.match
+        else:
+            self._regex_match = None
+
+    @classmethod
+    def _get_pattern(cls):
+        """
+        Return compiled REGEX_PATTERN, patterns are compiled on first use rather than on import,
+        so unused fields do not pay for it
+        """
+        pattern = cls.REGEX_PATTERN
+        if not isinstance(pattern, str):
+            return pattern
+
+        compiled_pattern = _COMPILED_PATTERNS.get(pattern)
+        if compiled_pattern is None:
+            # re2 syntax differs from `re`, only built-in patterns are written to mean the same for both
+            engine = regex_engine if pattern in _PORTABLE_PATTERNS else re
+            compiled_pattern = _COMPILED_PATTERNS[pattern] = engine.compile(pattern)
+
+        return compiled_pattern
+
+    def _build_error_templates(self):
+        self._min_length_error = self._error_template('shorter than min length', self._min_length)
+        self._max_length_error = self._error_template('longer than max length', self._max_length)
+        self._pattern_error = self._error_template('not a valid pattern')
 
     def _built_in_validation(self, value: str):
+        min_length = self._min_length
+        max_length = self._max_length
+        regex_match = self._regex_match
+        quick_check = self._quick_check
         value_length = len(value)
-        if self._min_length is not None and value_length < self._min_length:
-            raise ValueError(
-                self._get_error_message(
-                    field_name=self._field_name,
-                    field_value=value,
-                    error='shorter than min length',
-                    boundary_value=self._min_length,
-                )
-            )
 
-        if self._max_length is not None and value_length > self._max_length:
-            raise ValueError(
-                self._get_error_message(
-                    field_name=self._field_name,
-                    field_value=value,
-                    error='longer than max length',
-                    boundary_value=self._max_length,
-                )
+        if min_length is not None and value_length < min_length:
+            raise ValueError(self._min_length_error % (value, ))
+
+        if max_length is not None and value_length > max_length:
+            raise ValueError(self._max_length_error % (value, ))
+
+        # If a regex pattern is defined, use it to validate
+        if regex_match is not None and not ((quick_check is None or quick_check(value)) and regex_match(value)):
+            raise ValueError(self._pattern_error % (value, ))
+
+    def validate_batch(self, values):
+        """
+        Check min length, max length and regex pattern for many values at once
+
+        Parameters
+        ----------
+        values (Sequence[str]): values to be checked
+
+        Returns
+        -------
+        result (list[bool]): True for every valid value, else False
+        """
+        min_length = self._min_length
+        max_length = self._max_length
+        if self._regex_match is None:
+            matches = [True] * len(values)
+        else:
+            matches = self._match_batch(values)
+
+        return [
+            matched
+            and (min_length is None or len(value) >= min_length)
+            and (max_length is None or len(value) <= max_length)
+            for value, matched in zip(values, matches)
+        ]
+
+    def _match_batch(self, values):
+        """
+        Match regex pattern for many values at once, with Hyperscan for built-in patterns when it is installed,
+        else with the compiled pattern
+
+        Returns
+        -------
+        matches (list[bool]): True for every value matching the pattern, else False
+        """
+        database = self._get_hyperscan_database() if hyperscan is not None else None
+        if database is None:
+            regex_match = self._regex_match
+            return [regex_match(value) is not None for value in values]
+
+        matches = [False] * len(values)
+
+        def on_match(expression_id, start, end, flags, index):
+            matches[index] = True
+
+        for index, value in enumerate(values):
+            database.scan(value.encode(), match_event_handler=on_match, context=index)
+
+        return matches
+
+    @classmethod
+    def _get_hyperscan_database(cls):
+        """
+        Return Hyperscan database compiled from the pattern on first use, None for custom patterns as
+        Hyperscan reads some `re` syntax differently (e.g. `\\Z`, `\\v`)
+        """
+        source = cls.REGEX_PATTERN
+        if source not in _PORTABLE_PATTERNS:
+            return None
+
+        # Hyperscan reports matches anywhere in the value, anchor it the way the pattern is matched
+        expression = '\\A(?:%s)\\z' % source if cls.REGEX_FULL_MATCH else '\\A(?:%s)' % source
+        if expression not in _HYPERSCAN_DATABASES:
+            database = hyperscan.Database()
+            database.compile(
+                expressions=[expression.encode()], flags=hyperscan.HS_FLAG_SINGLEMATCH | hyperscan.HS_FLAG_UTF8
             )
+            _HYPERSCAN_DATABASES[expression] = database
 
-        if self.REGEX_PATTERN:
-            # If a regex pattern is defined, use it to validate
-            self._regex_validation(value)
+        return _HYPERSCAN_DATABASES[expression]
 
 
 class EmailField(StringField):
-    REGEX_PATTERN = re.compile(
-        r"^[a-z0-9!#$%&'*+/=?^_`{|}~-]+(?:\.[a-z0-9!#$%&'*+/=?^_`{|}~-]+)"
-        r"*@(?:[a-z0-9](?:[a-z0-9-]*[a-z0-9])?\.)+[a-z0-9](?:[a-z0-9-]*[a-z0-9])?$",
-        re.IGNORECASE
+    __slots__ = ()
+    # Character classes are spelled out in ASCII, `re` and re2 disagree on Unicode case folding
+    REGEX_PATTERN = (
+        r"[a-zA-Z0-9!#$%&'*+/=?^_`{|}~-]+(?:\.[a-zA-Z0-9!#$%&'*+/=?^_`{|}~-]+)"
+        r"*@(?:[a-zA-Z0-9](?:[a-zA-Z0-9-]*[a-zA-Z0-9])?\.)+[a-zA-Z0-9](?:[a-zA-Z0-9-]*[a-zA-Z0-9])?"
     )
+    REGEX_FULL_MATCH = True
+
+    @staticmethod
+    def _quick_check(value: str):
+        return '@' in value and not value.startswith('.') and not value.endswith('.')
 
 
 class URLField(StringField):
     """
     Validate if a piece string is a URL
     """
-    REGEX_PATTERN = re.compile(
-        r'^(?:http|ftp)s?://'
-        r'(?:(?:[A-Z0-9](?:[A-Z0-9-]{0,61}[A-Z0-9])?\.)+(?:[A-Z]{2,6}\.?|[A-Z0-9-]{2,}\.?)|'
-        r'localhost|'
-        r'\d{1,3}\.\d{1,3}\.\d{1,3}\.\d{1,3})'
-        r'(?::\d+)?'
-        r'(?:/?|[/?]\S+)$',
-        re.IGNORECASE
+    __slots__ = ()
+    # Character classes are spelled out, `re` and re2 disagree on Unicode digits, whitespace and case folding.
+    # The path excludes every character of Python `\s`, written as literals or `\x` escapes which all engines read
+    # the same (`\v` is a class of vertical whitespace for Hyperscan)
+    REGEX_PATTERN = (
+        r'(?:[hH][tT][tT][pP]|[fF][tT][pP])[sS]?://'
+        r'(?:(?:[a-zA-Z0-9](?:[a-zA-Z0-9-]{0,61}[a-zA-Z0-9])?\.)+(?:[a-zA-Z]{2,6}\.?|[a-zA-Z0-9-]{2,}\.?)|'
+        r'[lL][oO][cC][aA][lL][hH][oO][sS][tT]|'
+        r'[0-9]{1,3}\.[0-9]{1,3}\.[0-9]{1,3}\.[0-9]{1,3})'
+        r'(?::[0-9]+)?'
+        r'(?:/?|[/?][^\t\n\x0b\f\r \x1c-\x1f\x85\xa0'
+        '\u1680\u2000-\u200a\u2028\u2029\u202f\u205f\u3000'
+        r']+)'
     )
+    REGEX_FULL_MATCH = True
+
+    @staticmethod
+    def _quick_check(value: str):
+        return value[:8].lower().startswith(('http://', 'https://', 'ftp://', 'ftps://'))
+
+
+# Built-in patterns, written in a syntax every regex engine reads the same way
+_PORTABLE_PATTERNS = frozenset((EmailField.REGEX_PATTERN, URLField.REGEX_PATTERN))
 
 
 #######################
 # DateTime Validators #
 #######################
+# Formats parsed by dateutil the same way, tried before falling back to it. Day first formats
+# are left out, dateutil reads them month first
+FAST_DATETIME_FORMATS = ('%Y/%m/%d', '%Y/%m/%d %H:%M:%S')
+
+
+def _parse_datetime(value):
+    """
+    Convert value to datetime, ISO 8601 strings and FAST_DATETIME_FORMATS are handled by fast parsers,
+    others fall back to dateutil
+    """
+    try:
+        return parse_iso_datetime(value)
+    except (TypeError, ValueError):
+        pass
+
+    # strptime accepts a year shorter than 4 digits, which dateutil reads differently
+    if isinstance(value, str) and value[4:5] == '/':
+        for datetime_format in FAST_DATETIME_FORMATS:
+            try:
+                return datetime.strptime(value, datetime_format)
+            except ValueError:
+                pass
+
+    return parse(value)
+
+
+def _parse_date(value):
+    return _parse_datetime(value).date()
+
+
 class BaseDateField(Field):
     __field_type__ = None
+    __slots__ = ('_min_date', '_max_date', '_min_date_error', '_max_date_error')
+    DEFAULT_CONVERSION_FUNC = staticmethod(_parse_datetime)
 
     def __init__(self, *, min_date=None, max_date=None, **kwargs):
         self._min_date = min_date
         self._max_date = max_date
         super().__init__(**kwargs)
-        if not kwargs.get('_conversion_func'):
-            self.set_conversion_func(parse)
+        if not kwargs.get('custom_conversion'):
+            self.set_conversion_func(self.DEFAULT_CONVERSION_FUNC)
+
+    def _build_error_templates(self):
+        self._min_date_error = self._error_template('smaller than min date', self._min_date)
+        self._max_date_error = self._error_template('greater than max date', self._max_date)
 
     def _built_in_validation(self, value: any):
-        if self._max_date is not None and self._max_date:
-            if value > self._max_date:
-                raise ValueError(
-                    self._get_error_message(
-                        field_name=self._field_name,
-                        field_value=value,
-                        error='greater than max date',
-                        boundary_value=self._max_date,
-                    )
-                )
+        min_date = self._min_date
+        max_date = self._max_date
 
-        if self._min_date is not None and self._min_date:
-            if value < self._min_date:
-                raise ValueError(
-                    self._get_error_message(
-                        field_name=self._field_name,
-                        field_value=value,
-                        error='smaller than max date',
-                        boundary_value=self._min_date,
-                    )
-                )
+        if max_date is not None and value > max_date:
+            raise ValueError(self._max_date_error % (value, ))
+
+        if min_date is not None and value < min_date:
+            raise ValueError(self._min_date_error % (value, ))
 
 
 class DateField(BaseDateField):
     __field_type__ = date
-
-    def __init__(self, *arg, **kwargs):
-        super().__init__(**kwargs)
-        self.set_conversion_func(lambda value: parse(value).date())
+    __slots__ = ()
+    DEFAULT_CONVERSION_FUNC = staticmethod(_parse_date)
 
 
 class DateTimeField(BaseDateField):
     __field_type__ = datetime
+    __slots__ = ()
@@ -23,6 +23,7 @@ setup(
         'python-dateutil',
     ],
     extras_require={
-        'test': ['pytest']
+        'test': ['pytest'],
+        'speedups': ['numba', 'google-re2', 'ciso8601', 'hyperscan'],
     }
 )
@@ -24,6 +24,28 @@ class MatureAudienceForm(AudienceForm):
             raise ValidationError('Invalid last login year')
 
 
+class NicknameMixinForm(Form):
+    name = StringField(max_length=10)
+    nickname = StringField(max_length=10)
+
+
+class NicknameAudienceForm(MatureAudienceForm, NicknameMixinForm):
+    pass
+
+
+class MessageForm(Form):
+    data = StringField()
+    errors_count = IntField()
+
+    @staticmethod
+    def clean_data(value: str):
+        return value.strip()
+
+    @classmethod
+    def clean_errors_count(cls, value: int):
+        return value + 1
+
+
 class TestForm(TestCase):
     def setUp(self):
         self.form = MatureAudienceForm(
@@ -58,6 +80,13 @@ class TestForm(TestCase):
         self.assertFalse(self.form.is_valid())
         self.assertEqual(str(self.form.errors['name'][0]), 'Invalid name for audience')
 
+    def test_form_clean_is_detected_on_class_creation(self):
+        self.assertFalse(AudienceForm._has_clean)
+        self.assertTrue(MatureAudienceForm._has_clean)
+
+    def test_field_cleaners_are_inherited_from_base_form(self):
+        self.assertEqual({'name': 'clean_name'}, MatureAudienceForm._field_cleaners)
+
     def test_form_custom_clean_name_called_and_raise_validation_error(self):
         self.form._raise_exception_on_error = True
         with self.assertRaises(ValidationError) as ex:
@@ -76,3 +105,47 @@ class TestForm(TestCase):
 
         self.assertFalse(form.is_valid())
         self.assertEqual(str(form.errors['MatureAudienceForm'][0]), 'Invalid last login year')
+
+    def test_cleaned_data_contains_cleaned_values(self):
+        form = AudienceForm({'name': 'Aaron'})
+
+        self.assertTrue(form.is_valid())
+        self.assertEqual({'name': 'Aaron'}, form.cleaned_data)
+
+    def test_missing_nullable_field_is_skipped(self):
+        form = MatureAudienceForm({'name': 'Aaron', 'age': 60})
+        form.is_valid()
+
+        self.assertNotIn('last_login', form.errors)
+        self.assertNotIn('last_login', form.cleaned_data)
+
+    def test_missing_required_field_is_reported(self):
+        form = MatureAudienceForm({'name': 'Aaron', 'last_login': '2000-06-19 11:08:28.649039'})
+
+        self.assertFalse(form.is_valid())
+        self.assertTrue(isinstance(form.errors['age'][0], KeyError))
+
+    def test_declared_fields_are_merged_from_all_bases(self):
+        self.assertEqual(
+            {
+                'name': AudienceForm.declared_fields['name'],
+                'nickname': NicknameMixinForm.declared_fields['nickname'],
+                'age': MatureAudienceForm.declared_fields['age'],
+                'last_login': MatureAudienceForm.declared_fields['last_login'],
+            },
+            NicknameAudienceForm.declared_fields
+        )
+
+    def test_field_named_as_form_attribute_does_not_override_form_state(self):
+        form = MessageForm({'data': 'hello', 'errors_count': 0})
+
+        self.assertIsNone(form.data)
+        self.assertTrue(form.is_valid())
+        self.assertEqual('hello', form.data)
+        self.assertEqual({'data': 'hello', 'errors_count': 0}, form._data)
+
+    def test_static_and_class_method_field_cleaners_are_called(self):
+        form = MessageForm({'data': ' hello ', 'errors_count': 0})
+
+        self.assertTrue(form.is_valid())
+        self.assertEqual({'data': 'hello', 'errors_count': 1}, form.cleaned_data)
@@ -1,9 +1,16 @@
+import gc
+import math
+import re
+import weakref
 from datetime import date, datetime
-from unittest import TestCase
+from unittest import TestCase, mock, skipIf
 
+from pyvalidator.core import validators
 from pyvalidator.core.exceptions import ConversionError
 from pyvalidator.core.validators import (
+    Field,
     IntField,
+    FloatField,
     StringField,
     EmailField,
     URLField,
@@ -15,6 +22,8 @@ class Audience:
     """
     This class is implemented for testing purpose only
     """
+    __slots__ = ('_age', '_name', '_email', '_social_media_link', '_date_of_birth', '_created_at')
+
     age = IntField(min_value=18, max_value=60, nullable=False, force_conversion=True)
     name = StringField(min_length=1, max_length=5, nullable=True, force_conversion=True)
     email = EmailField()
@@ -24,8 +33,27 @@ class Audience:
 
 
 class BaseFieldTestCase(TestCase):
-    def setUp(self):
-        self.test_audience = Audience()
+    @classmethod
+    def setUpClass(cls):
+        cls.test_audience = Audience()
+
+    def tearDown(self):
+        # The instance is shared by all tests of the class, reset values set by the test
+        for slot in Audience.__slots__:
+            if hasattr(self.test_audience, slot):
+                delattr(self.test_audience, slot)
+
+    def assert_conversion_failed_with_invalid_date_str(self, field_name):
+        invalid_date_strings = (
+            'a',
+            '200-10-2000',
+        )
+        for date_string in invalid_date_strings:
+            with self.subTest(date_string=date_string):
+                with self.assertRaises(ConversionError) as ex:
+                    setattr(self.test_audience, field_name, date_string)
+
+                self.assertEqual(str(ex.exception), 'Unknown string format: %s' % date_string)
 
 
 class TestIntField(BaseFieldTestCase):
@@ -58,8 +86,214 @@ class TestIntField(BaseFieldTestCase):
         self.assertTrue(isinstance(self.test_audience.age, int))
         self.assertEqual(18, self.test_audience.age)
 
+    def test_age_field_failed_with_wrong_type_returned_by_conversion(self):
+        class Person:
+            age = IntField(force_conversion=True, custom_conversion=float)
+
+        with self.assertRaises(ValueError) as ex:
+            Person().age = '18'
+
+        self.assertEqual("age value is not a valid type for <class 'int'>", str(ex.exception))
+
+    def test_age_field_failed_with_none_on_set(self):
+        with self.assertRaises(ValueError) as ex:
+            self.test_audience.age = None
+
+        self.assertEqual('age field is not nullable', str(ex.exception))
+
+    def test_age_field_validate_batch(self):
+        self.assertEqual(
+            [False, True, True, False],
+            list(Audience.age.validate_batch([17, 18, 60, 61]))
+        )
+
+    def test_age_field_value_is_not_shared_between_instances(self):
+        other_audience = Audience()
+        self.test_audience.age = 18
+        other_audience.age = 20
+
+        self.assertEqual(18, self.test_audience.age)
+        self.assertEqual(20, other_audience.age)
+
+    def test_age_field_value_is_stored_in_slot(self):
+        self.test_audience.age = 18
+
+        self.assertFalse(hasattr(self.test_audience, '__dict__'))
+        self.assertEqual(18, self.test_audience._age)
+
+    def test_age_field_value_is_stored_in_dict_without_slot(self):
+        class Person:
+            age = IntField()
+
+        person = Person()
+        person.age = 18
+
+        self.assertEqual({'_age': 18}, person.__dict__)
+
+    @mock.patch.dict(Field._INTERNED, clear=True)
+    def test_interned_field_declared_slotted_first_stores_value_by_owner(self):
+        class SlottedPerson:
+            __slots__ = ('_height', )
+            height = IntField.interned(min_value=0)
+
+        class Person:
+            height = IntField.interned(min_value=0)
+
+        self.assert_interned_field_stores_value_by_owner(SlottedPerson(), Person())
+
+    @mock.patch.dict(Field._INTERNED, clear=True)
+    def test_interned_field_declared_plain_first_stores_value_by_owner(self):
+        class Person:
+            height = IntField.interned(min_value=0)
+
+        class SlottedPerson:
+            __slots__ = ('_height', )
+            height = IntField.interned(min_value=0)
+
+        self.assert_interned_field_stores_value_by_owner(SlottedPerson(), Person())
+
+    def assert_interned_field_stores_value_by_owner(self, slotted_person, plain_person):
+        self.assertIs(type(slotted_person).height, type(plain_person).height)
+
+        slotted_person.height = 170
+        plain_person.height = 180
+
+        self.assertEqual(170, slotted_person._height)
+        self.assertEqual({'_height': 180}, plain_person.__dict__)
+        self.assertEqual(170, slotted_person.height)
+        self.assertEqual(180, plain_person.height)
+
+    def test_interned_field_does_not_keep_owner_alive(self):
+        class Person:
+            age = IntField.interned(min_value=0, max_value=100)
+
+        Person().age = 18
+        owner = weakref.ref(Person)
+        del Person
+        gc.collect()
+
+        self.assertIsNone(owner())
+
+    def test_field_attached_after_class_creation_must_be_bound(self):
+        class Person:
+            pass
+
+        Person.age = IntField(default=18)
+        person = Person()
+
+        self.assertEqual(18, person.age)
+        with self.assertRaises(ValueError) as ex:
+            person.age = 20
+
+        self.assertEqual(
+            'IntField is not bound to an attribute name, declare it in a class body or bind it with '
+            '__set_name__(owner, name)',
+            str(ex.exception)
+        )
+
+        Person.age.__set_name__(Person, 'age')
+        person.age = 20
+        self.assertEqual(20, person.age)
+
+    def test_unset_field_returns_default(self):
+        self.assertIsNone(self.test_audience.age)
+
+    def test_age_field_class_access_returns_field(self):
+        self.assertTrue(isinstance(Audience.age, IntField))
+
+    def test_interned_fields_are_shared_for_same_settings(self):
+        field = IntField.interned(min_value=0, max_value=100)
+
+        self.assertIs(field, IntField.interned(max_value=100, min_value=0))
+        self.assertIsNot(field, IntField.interned(min_value=0, max_value=10))
+        self.assertIsNot(field, IntField.interned(min_value=0, max_value=100, custom_validators=[print]))
+
+    @mock.patch.dict(Field._INTERNED, clear=True)
+    def test_interned_fields_are_not_shared_for_equal_settings_of_other_types(self):
+        field = IntField.interned(default=1, nullable=0)
+
+        self.assertIsNot(field, IntField.interned(default=True, nullable=0))
+        self.assertIsNot(field, IntField.interned(default=1, nullable=False))
+        self.assertIs(True, IntField.interned(default=True, nullable=0)._default)
+
+    def test_field_cannot_be_declared_with_another_name(self):
+        with self.assertRaises(ValueError) as ex:
+            Audience.age.__set_name__(Audience, 'other_age')
+
+        self.assertEqual('IntField is already declared as age, it cannot be declared as other_age', str(ex.exception))
+
+    def test_built_in_fields_have_no_instance_dict(self):
+        for field in Audience.__dict__.values():
+            if isinstance(field, IntField | StringField | DateField):
+                self.assertFalse(hasattr(field, '__dict__'))
+
+
+class TestFloatField(TestCase):
+    def test_float_field_failed_with_value_out_of_range_on_set(self):
+        class Product:
+            weight = FloatField(min_value=0.5, max_value=2)
+
+        with self.assertRaises(ValueError) as ex:
+            Product().weight = 0.25
+
+        self.assertEqual('Field `weight` value 0.25 is smaller than min value 0.5', str(ex.exception))
+
+    def test_float_field_validate_batch(self):
+        class Product:
+            weight = FloatField(min_value=0.5, max_value=2)
+            price = FloatField()
+
+        self.assertEqual([False, True, True, False], list(Product.weight.validate_batch([0.25, 0.5, 2.0, 2.5])))
+        # NaN passes the boundaries check, as it does on set
+        self.assertEqual([True, True], list(Product.price.validate_batch([1.0, math.nan])))
+
 
 class TestStringField(BaseFieldTestCase):
+    def test_custom_pattern_is_compiled_with_re(self):
+        class LookaheadField(StringField):
+            REGEX_PATTERN = r'(?=[a-z])\w+$'
+
+        self.assertIsInstance(LookaheadField._get_pattern(), re.Pattern)
+        self.assertEqual([True, False], LookaheadField().validate_batch(['abc', '1bc']))
+
+    def test_validate_batch_with_custom_pattern_does_not_use_hyperscan(self):
+        class AbcField(StringField):
+            REGEX_PATTERN = r'abc\Z'
+
+        with mock.patch.object(validators, 'hyperscan') as hyperscan_mock:
+            self.assertEqual([True, False], AbcField().validate_batch(['abc', 'abc\n']))
+
+        hyperscan_mock.Database.assert_not_called()
+
+    @skipIf(validators.hyperscan is None, 'hyperscan is not installed')
+    def test_validate_batch_with_hyperscan_matches_validation_on_set(self):
+        values_by_field = {
+            'email': ('test.valid1@test.com', 'a@b.com\n', 'invalid5@test', 'ſ@test.com', 'a\xa0@test.com'),
+            'social_media_link': (
+                'https://test.com/path?query=1',
+                'HTTP://test.com',
+                'http://test.com\n',
+                'http://test.com/a\x0bb',
+                'http://test.com/a\u2028b',
+                'http://\u0661.1.1.1',
+                'http://test.com/\u00e9',
+            ),
+        }
+
+        for field_name, values in values_by_field.items():
+            for value, matched in zip(values, getattr(Audience, field_name).validate_batch(values)):
+                with self.subTest(field_name=field_name, value=value):
+                    try:
+                        setattr(self.test_audience, field_name, value)
+                    except ValueError:
+                        self.assertFalse(matched)
+                    else:
+                        self.assertTrue(matched)
+
+    def test_name_field_accepts_none_when_nullable(self):
+        self.test_audience.name = None
+        self.assertIsNone(self.test_audience.name)
+
     def test_name_field_failed_with_invalid_min_length_string_on_set(self):
         with self.assertRaises(ValueError) as ex:
             self.test_audience.name = ''
@@ -77,95 +311,166 @@ class TestStringField(BaseFieldTestCase):
             str(ex.exception)
         )
 
+    def test_name_field_error_message_keeps_percent_sign_in_value(self):
+        with self.assertRaises(ValueError) as ex:
+            self.test_audience.name = '100%s!'
+
+        self.assertEqual(
+            'Field `name` value 100%s! is longer than max length 5',
+            str(ex.exception)
+        )
+
 
 class TestEmailField(BaseFieldTestCase):
     def test_email_failed_with_invalid_email_on_set(self):
-        invalid_emails = {
+        invalid_emails = (
             '.invalid1@test.com',
             'invalid2@test.com.',
             '@invalid3@test.com',
             'invalid4test.com',
             'invalid5@test',
-        }
+            'invalid6@test.com\n',
+            '',
+        )
 
         for email in invalid_emails:
-            with self.assertRaises(ValueError) as ex:
-                self.test_audience.email = email
+            with self.subTest(email=email):
+                with self.assertRaises(ValueError) as ex:
+                    self.test_audience.email = email
 
-            self.assertEqual(
-                'Field `email` value {} is not a valid pattern'.format(email),
-                str(ex.exception)
-            )
+                self.assertEqual(
+                    'Field `email` value {} is not a valid pattern'.format(email),
+                    str(ex.exception)
+                )
 
     def test_email_with_valid_email_on_set(self):
-        valid_emails = {
+        valid_emails = (
             'test.valid1@test.com',
             'valid2@test.domain.com',
-        }
+        )
 
         for email in valid_emails:
-            # Ensure no ValueError is raised
-            self.test_audience.email = email
+            with self.subTest(email=email):
+                # Ensure no ValueError is raised
+                self.test_audience.email = email
+
+    def test_email_pattern_is_compiled_once(self):
+        pattern = EmailField._get_pattern()
+
+        self.assertFalse(isinstance(pattern, str))
+        self.assertIs(pattern, EmailField._get_pattern())
+
+    def test_email_field_reuses_compiled_pattern(self):
+        self.assertIs(EmailField._get_pattern(), Audience.email._regex_match.__self__)
+
+    def test_email_field_subclass_shares_compiled_pattern(self):
+        class WorkEmailField(EmailField):
+            pass
+
+        self.assertIs(EmailField._get_pattern(), WorkEmailField._get_pattern())
+
+    def test_email_validate_batch(self):
+        self.assertEqual(
+            [True, False, False, False],
+            Audience.email.validate_batch(['test.valid1@test.com', 'invalid4test.com', 'invalid5@test.com.', 'a@b.com\n'])
+        )
 
 
 class TestURLField(BaseFieldTestCase):
+    def test_media_link_field_reuses_compiled_pattern(self):
+        self.assertIs(URLField._get_pattern(), Audience.social_media_link._regex_match.__self__)
+        self.assertIs(URLField._get_pattern(), URLField()._regex_match.__self__)
+
+    def test_media_link_validate_batch(self):
+        self.assertEqual(
+            [True, True, False, False],
+            Audience.social_media_link.validate_batch(['https://test.com', 'HTTP://test.com', 'test.com:8000', 'http://test'])
+        )
 
     def test_media_link_with_invalid_url_on_set(self):
-        invalid_urls = {
+        invalid_urls = (
             'http:/test.com:8080',
             'test.com:8000',
             'http://test',
-        }
+            'http://test.com\n',
+            'http://\u0661.1.1.1',
+            'http://test.com/a\xa0b',
+            'http://test.com/\u3000',
+            'http://test.com/a\u2028b',
+            'http://test.com/\x1c',
+            'http://test.com/\x85x',
+            'http://test.com/a\x0bb',
+        )
 
         for url in invalid_urls:
-            with self.assertRaises(ValueError) as ex:
-                self.test_audience.social_media_link = url
+            with self.subTest(url=url):
+                with self.assertRaises(ValueError) as ex:
+                    self.test_audience.social_media_link = url
 
-            self.assertEqual(
-                'Field `social_media_link` value {} is not a valid pattern'.format(url),
-                str(ex.exception)
-            )
+                self.assertEqual(
+                    'Field `social_media_link` value {} is not a valid pattern'.format(url),
+                    str(ex.exception)
+                )
 
     def test_media_link_with_valid_url_on_set(self):
-        valid_urls = {
+        valid_urls = (
             'https://test.com',
-            'http://test.com'
-        }
+            'http://test.com',
+            'HTTP://test.com',
+            'ftp://test.com',
+        )
 
         for url in valid_urls:
-            # Ensure no ValueError is raised
-            self.test_audience.social_media_link = url
+            with self.subTest(url=url):
+                # Ensure no ValueError is raised
+                self.test_audience.social_media_link = url
 
 
 class TestDateField(BaseFieldTestCase):
     def test_invalid_date_str(self):
-        invalid_date_strings = {
-            'a',
-            '200-10-2000',
-        }
-        for date_string in invalid_date_strings:
-            with self.assertRaises(ConversionError) as ex:
-                self.test_audience.date_of_birth = date_string
-
-            self.assertEqual(str(ex.exception), 'Unknown string format: %s' % date_string)
+        self.assert_conversion_failed_with_invalid_date_str('date_of_birth')
 
     def test_valid_date_str_get_converted_to_date_object(self):
         self.test_audience.date_of_birth = '2000-11-07'
         self.assertTrue(isinstance(self.test_audience.date_of_birth, date))
 
+    def test_slash_separated_date_str_get_converted_to_date_object(self):
+        self.test_audience.date_of_birth = '2000/11/07'
+        self.assertEqual(date(2000, 11, 7), self.test_audience.date_of_birth)
+
+    def test_date_field_failed_with_invalid_min_date_on_set(self):
+        class Person:
+            date_of_birth = DateField(min_date=date(2000, 1, 1), force_conversion=True)
+
+        with self.assertRaises(ValueError) as ex:
+            Person().date_of_birth = '1999-12-31'
+
+        self.assertEqual(
+            'Field `date_of_birth` value 1999-12-31 is smaller than min date 2000-01-01',
+            str(ex.exception)
+        )
+
+    def test_custom_conversion_is_not_replaced(self):
+        field = DateField(custom_conversion=lambda value: date(2000, 1, 1))
+        self.assertEqual(date(2000, 1, 1), field._conversion_func('anything'))
+
 
 class TestDateTimeField(BaseFieldTestCase):
     def test_invalid_date_str(self):
-        invalid_date_strings = {
-            'a',
-            '200-10-2000',
-        }
-        for date_string in invalid_date_strings:
-            with self.assertRaises(ConversionError) as ex:
-                self.test_audience.created_at = date_string
-
-            self.assertEqual(str(ex.exception), 'Unknown string format: %s' % date_string)
+        self.assert_conversion_failed_with_invalid_date_str('created_at')
 
     def test_valid_date_str_get_converted_to_datetime_object(self):
         self.test_audience.created_at = '2000-11-07'
         self.assertTrue(isinstance(self.test_audience.created_at, datetime))
+
+    def test_valid_datetime_str_get_converted_to_datetime_object(self):
+        self.test_audience.created_at = '2000-06-19 11:08:28.649039'
+        self.assertEqual(datetime(2000, 6, 19, 11, 8, 28, 649039), self.test_audience.created_at)
+
+    def test_slash_separated_datetime_str_get_converted_to_datetime_object(self):
+        self.test_audience.created_at = '2000/06/19 11:08:28'
+        self.assertEqual(datetime(2000, 6, 19, 11, 8, 28), self.test_audience.created_at)
+
+    def test_non_iso_datetime_str_get_converted_to_datetime_object(self):
+        self.test_audience.created_at = 'June 19 2000 11:08'
+        self.assertEqual(datetime(2000, 6, 19, 11, 8), self.test_audience.created_at)